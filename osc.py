@@ -1,5 +1,5 @@
 ################################################################################################################
-# osc.py       Version 1.74     27-Mar-2023     Taj Ballinger, David Johnson, and Bill Manaris
+# osc.py       Version 1.75     14-Oct-2026     Taj Ballinger, David Johnson, Bill Manaris, and contributors
 
 ###########################################################################
 #
@@ -30,11 +30,34 @@
 # To use this module, add it to
 #     ' /Processing/libraries/site-packages '
 # And import it in your Processing code with
-#     ' from oscv1_74 import OscIn, OscMessage '
+#     ' from osc import OscIn, OscMessage '
 #
 #
 # REVISIONS:
 #
+#   1.75    14-Oct-2026 (ag) Reworked OscIn dispatch for high-rate OSC streams.
+#                       -ProcessingListener now matches addresses as regular expressions (e.g. ALL_MESSAGES works).
+#                        Compiled patterns are cached and shared across listeners.
+#                       -OscIn registers a single ProcessingListener with OscP5, which scans all registered addresses.
+#                        Registering the same function twice for an address no longer calls it twice.
+#                        API change: since a ProcessingListener no longer stands for one address, its per-address
+#                        getAddress(), setAddress() and addFunction() were removed - use OscIn.onInput() instead.
+#                       -OSCMessage wraps the incoming OscP5 message instead of copying it, so getArguments()
+#                        returns the message's own argument array (indexed like a list, not wrapped in a tuple).
+#                        Added getArgumentsAsList(), for when a Python list is needed.
+#                       -Literal addresses (no regular expression characters) are matched by dictionary lookup,
+#                        and ALL_MESSAGES (or any literal prefix followed by ".*") without running a regular expression.
+#                       -OscIn no longer prints incoming messages by default (call showMessages() to see them).
+#                       -OscIn sets its UDP receive buffer to 1 MB (see the rcvBufBytes constructor argument).
+#                       -Incoming addresses are checked only against patterns whose literal prefix they start with,
+#                        and the functions each incoming address matched are remembered for its next message.
+#                       -Added OscIn.stop(), and fixed dispose() so that it actually empties _ActiveOscInObjects_.
+#                       -_ActiveOscInObjects_ holds weak references, so it does not itself keep OscIn objects alive.
+#                        (OscP5 still keeps its OscIn alive while receiving - an OscIn must be stop()ped, or
+#                        closed by dispose(), to free its port.)
+#                       -Registered functions are called from a separate dispatcher thread, so that slow functions
+#                        do not keep OscP5 from receiving messages.  OscP5's receiving thread gets maximum priority.
+#
 #   1.74    27-Mar-2023 (tb) Added dispose() to close OscObjects between program runs, as in 1.2
 #                       Known issues:
 #                          -OscEvent uses an equivalence conditional that doesn't recognize regular expressions.
@@ -99,6 +122,14 @@
 
 add_library( 'oscP5' )
 from oscP5 import OscEventListener, OscMessage, OscPacket, OscP5, OscNetManager
+from java.lang import InterruptedException, Runnable, Thread
+from java.util import ArrayList
+from java.util.concurrent import ArrayBlockingQueue, TimeUnit
+from collections import OrderedDict
+import re
+import sys
+import traceback
+import weakref
 #from netP5 import NetAddress
 #from java.net import InetAddress
 
@@ -109,14 +140,140 @@ from oscP5 import OscEventListener, OscMessage, OscPacket, OscP5, OscNetManager
 #import socket
 
 ### keep track of active osc objects, so we can stop them when the program ends
-try:
-   # already defined (from an earlier run, do nothing, as it already contains material)
-   _ActiveOscInObjects_
+#   if already defined (from an earlier run), keep it, as it already contains material -
+#   otherwise (first run), define it to hold active objects
+#   (weakly, so that this set does not itself keep them alive - note that each OscIn's OscP5 keeps
+#   it alive while receiving anyway, and that garbage collecting an OscIn would not free its port,
+#   so OscIn objects must be stopped, by stop() or dispose(), to free their ports)
+_ActiveOscInObjects_  = globals().setdefault( '_ActiveOscInObjects_', weakref.WeakSet() )
+#   _ActiveOscOutObjects_ = globals().setdefault( '_ActiveOscOutObjects_', weakref.WeakSet() ) # not yet implemented
+
+### compiled OSC address patterns, keyed by address string, so that identical patterns share one
+#   compiled object (compilation is expensive, matching is cheap).  Oldest entries are dropped first,
+#   so that a flood of unique addresses cannot grow the cache without bound.
+_PATTERN_CACHE_      = OrderedDict()
+_PATTERN_CACHE_SIZE_ = 500
+
+### how many incoming addresses each OscIn remembers matches for (see ProcessingListener.dispatch())
+_ADDRESS_CACHE_SIZE_ = 256
+
+### how often (at most) an idle dispatcher thread checks whether it should stop (see ProcessingListener.run())
+_STOP_CHECK_MILLISECONDS_ = 100
+
+### characters that make an OSC address a regular expression, rather than a literal address
+_PATTERN_METACHARACTERS_ = re.compile( r'[.^$*+?{}\[\]\\|()]' )
+
+### stands in for the compiled pattern of addresses that match anything starting with their
+#   literal prefix, such as ALL_MESSAGES ("/.*") or "/1/.*" (no regular expression needs to run,
+#   since ProcessingListener only checks addresses that start with that prefix)
+_MATCH_PREFIX_ = object()
+
+def _compilePattern_(oscAddress):
+   """
+   Returns the compiled regular expression for oscAddress, reusing a cached one if available.
+   Returns None if oscAddress is a literal address (no regular expression is needed to match it),
+   and _MATCH_PREFIX_ if it is a literal prefix followed by ".*".
+   """
+
+   ### literal addresses are matched by simple string comparison
+   if _PATTERN_METACHARACTERS_.search( oscAddress ) is None:
+      return None
+
+   ### a literal prefix followed by ".*" matches anything starting with that prefix
+   prefix = _staticPrefix_( oscAddress )
+   if oscAddress == prefix + ".*" and _PATTERN_METACHARACTERS_.search( prefix ) is None:
+      return _MATCH_PREFIX_
+
+   regex = _PATTERN_CACHE_.get( oscAddress )
+
+   if regex is None:
+      ### make room, if needed (first in, first out)
+      if len(_PATTERN_CACHE_) >= _PATTERN_CACHE_SIZE_:
+         _PATTERN_CACHE_.popitem( last = False )
+
+      ### the whole address must match, not just its beginning
+      regex = re.compile( '^' + oscAddress + '$' )
+      _PATTERN_CACHE_[oscAddress] = regex
+
+   return regex
+
+
+def _staticPrefix_(oscAddress):
+   """
+   Returns the literal beginning of oscAddress (i.e., the part before any regular expression),
+   which every address it matches must start with.
+   """
+
+   ### alternatives (e.g. "/a|/b") may start with anything
+   if "|" in oscAddress:
+      return ""
+
+   match = _PATTERN_METACHARACTERS_.search( oscAddress )
+
+   ### literal addresses are all prefix
+   if match is None:
+      return oscAddress
+
+   ### these make the preceding character optional (e.g. "/1/fader1?" matches "/1/fader"), so exclude it
+   if match.group() in "*?{":
+      return oscAddress[:max(match.start() - 1, 0)]
+
+   return oscAddress[:match.start()]
+
+
+### netP5 classes whose UDP socket receives incoming messages (as opposed to e.g. netP5.UdpClient,
+#   which sends).  These are the class names of oscP5 0.9.x's netP5 (where UdpServer extends
+#   AbstractUdpServer, which holds the socket) - other versions may name them differently,
+#   in which case no socket is found and OscIn keeps the default receive buffer (see OscIn()).
+_UDP_SERVER_CLASSES_ = ("netP5.UdpServer", "netP5.AbstractUdpServer")
+
+def _findDatagramSockets_(javaObject, depth = 3):
+   """
+   Returns the UDP sockets that receive incoming messages for javaObject (e.g. an OscP5 object).
+   OscP5 does not expose its sockets, so we look for them among the fields of javaObject and of
+   the oscP5/netP5 objects it holds.  Only the sockets of netP5 servers are returned (not those of
+   netP5 clients, which send).
+   """
+
+   sockets = []
+
+   ### only servers' sockets receive (see _UDP_SERVER_CLASSES_)
+   javaClass = javaObject.getClass()
+   isServer  = javaClass.getName() in _UDP_SERVER_CLASSES_
 
-except:
-   # first run - define to hold active objects
-   _ActiveOscInObjects_  = []   
-#   _ActiveOscOutObjects_ = [] # not yet implemented
+   ### look through the fields of javaObject's class (and superclasses)
+   while javaClass is not None:
+      for field in javaClass.getDeclaredFields():
+
+         ### decide by the field's declared type, not by its value, since Jython converts some values
+         #   to Python objects (e.g. strings, numbers, and OscP5's parent - the OscIn object itself)
+         fieldTypeName = field.getType().getName()
+         isSocket = isServer and fieldTypeName in ("java.net.DatagramSocket", "java.net.MulticastSocket")
+         isNetP5  = depth > 1 and fieldTypeName.startswith( ("oscP5.", "netP5.") )
+
+         if not (isSocket or isNetP5):
+            continue
+
+         try:
+            field.setAccessible( True )
+            value = field.get( javaObject )
+
+            if value is None:
+               continue
+
+            if isSocket:
+               sockets.append( value )
+
+            ### follow only oscP5/netP5 objects (not e.g. the sketch that created them)
+            else:
+               sockets.extend( _findDatagramSockets_( value, depth - 1 ) )
+
+         except:   # e.g. not accessible in this JVM - skip it
+            continue
+
+      javaClass = javaClass.getSuperclass()
+
+   return sockets
 
 
 #################### OscIn ##############################
@@ -128,9 +285,16 @@ except:
 #
 # The constructor expects the port number (your choice) to listen for incoming messages.
 #
+# Messages are received through OscP5 (the only receiving backend).  This library runs under
+# Python Mode's Jython, on the JVM, so native socket interfaces (e.g., Linux's io_uring) are not
+# available to it.  For high message rates, see the rcvBufBytes constructor argument instead.
+#
 # When instantiated, the OscIn object outputs (print out) its host IP number and its port 
 # (for convenience).  Use this info to set up the OSC clients used to send messages here.
 #
+# An OscIn object keeps its port until it is stopped, with stop(), or by dispose() when the
+# program ends (dropping all references to it does not free the port).
+#
 # NOTE:  To send messages here you may use objects of the OscOut class below, or another OSC client, 
 # such as TouchOSC iPhone client (http://hexler.net/software/touchosc).  
 
@@ -174,70 +338,122 @@ ALL_MESSAGES = "/.*"
 
 class OscIn():
 
-   def __init__(self, port = 57110):
+   def __init__(self, port = 57110, rcvBufBytes = 1048576):
 
       self.port  = port                     # holds port to listen to (for incoming events/messages)
       self.oscIn = OscP5( self, self.port ) # create port
 
       ### OscP5 prints receiving IP Address and Port number when instantiated
 
-      ### create dictionary to hold registered callback functions, so that we can replace them
+      ### enlarge the socket's receive buffer (the JVM default may be only a few KB), so that 
+      #   bursts of incoming messages are not dropped by the operating system before we read them
+      #   (the operating system may cap this - e.g., Linux's net.core.rmem_max)
+      #   if OscP5's receiving socket cannot be found or changed, the default buffer size is kept (and we say so)
+      try:
+         sockets = _findDatagramSockets_( self.oscIn )
+         if not sockets:
+            print "OscIn: Could not find OscP5's receiving socket, so its receive buffer size was not changed."
+         for socket in sockets:
+            socket.setReceiveBufferSize( rcvBufBytes )
+      except:
+         print "OscIn: Could not change the receive buffer size of OscP5's socket (" + str( sys.exc_info()[1] ) + ")."
+
+      ### create a single listener to receive every incoming message for this port
+      #   (OscP5 calls each of its listeners for every message, so one listener that scans
+      #   all registered addresses is cheaper than one listener per address)
+      self._dispatcher = ProcessingListener()
+      self.oscIn.addListener( self._dispatcher )
+
+      ### call registered functions from a separate thread, so that slow functions do not
+      #   keep OscP5 from receiving the next messages (see ProcessingListener.run())
+      self._dispatchThread = Thread( self._dispatcher, "OscIn dispatcher (port " + str(self.port) + ")" )
+      self._dispatchThread.setDaemon( True )
+      self._dispatchThread.start()
+
+      ### create dictionary to hold registered callback functions, so that we can update them
       #   when a new call to onInput() is made for a given address - the dictionary key is the
-      #   address, and the dictionary value is the GenericListener created for this address,
-      #   so that may update the callback function it is associated with.
+      #   address, and the dictionary value is the position of that address' entry in the
+      #   dispatcher's entries list.
       self.oscAddressHandlers = {}
       
-      ### print all incoming OSC messages by default
-      self.showIncomingMessages = True
-
-      ### provide a default OSC message handler 
-      #   prints out all incoming OSC messages (if desired - see showMessages() and hideMessages())
-      self.onInput( ALL_MESSAGES, self. _printIncomingMessage_ )
+      ### do not print incoming OSC messages by default
+      #   (printing every message slows down the thread that receives them - see showMessages() 
+      #   and hideMessages(), which register and remove the default message printer)
+      self.showIncomingMessages = False
 
       ### remember this OscIn object so that it can be closed when the program ends
-      _ActiveOscInObjects_.append( self )
+      _ActiveOscInObjects_.add( self )
 
 
    def onInput( self, oscAddress, function ):
       """
       Associate callback function to an incoming oscAddress.
-      oscAddresses are strings that resemble URLs (e.g. "/hello/world")
+      oscAddresses are strings that resemble URLs (e.g. "/hello/world"), and may
+      be regular expressions (e.g. "/.*" or "/1/fader[0-9]").
       """
 
+      ### intern address, so that its hash is computed once and later lookups are cheap
+      oscAddress = intern( str( oscAddress ) )
+
       ### register callback function for oscAddress
       #   if oscAddress is already registered, append function to its entry
-      if self.oscAddressHandlers.has_key( oscAddress ):
-         self.oscAddressHandlers[oscAddress].addFunction( function )
+      #   (unless it is already there, e.g. when onInput() is called from draw())
+      #   (entries hold functions in a tuple, which is rebuilt here and iterated for every message)
+      #   (entries are updated in a copy, so that messages being dispatched are not affected)
+      index = self.oscAddressHandlers.get( oscAddress )
+      if index is not None:
+         oscAddress, regex, functions = self._dispatcher.entries[index]
+         if function not in functions:
+            entries = list( self._dispatcher.entries )
+            entries[index] = (oscAddress, regex, functions + (function,))
+            self._dispatcher.setEntries( entries )
 
       #   otherwise, add new entry for it
       else:
-         ### create new listener
-         eventHandler = ProcessingListener( oscAddress, function )
-         ### register it
-         self.oscAddressHandlers[oscAddress] = eventHandler
-         ### activate it
-         self.oscIn.addListener( eventHandler )
+         ### remember where its entry is
+         self.oscAddressHandlers[oscAddress] = len( self._dispatcher.entries )
+         ### and activate it
+         entries = self._dispatcher.entries + [ (oscAddress, _compilePattern_( oscAddress ), (function,)) ]
+         self._dispatcher.setEntries( entries )
+
+
+   def _removeInput_( self, oscAddress, function ):
+      """Dissociate callback function from oscAddress (if associated)."""
+
+      index = self.oscAddressHandlers.get( oscAddress )
+      if index is not None:
+
+         ### remove function from a copy of the entries, so that messages being dispatched are not affected
+         entries = list( self._dispatcher.entries )
+         oscAddress, regex, functions = entries[index]
+         functions = tuple( [f for f in functions if f != function] )
+
+         if functions:   # other functions remain registered to oscAddress
+            entries[index] = (oscAddress, regex, functions)
+
+         else:           # nothing else uses oscAddress, so forget it (and update positions of later entries)
+            del entries[index]
+            del self.oscAddressHandlers[oscAddress]
+            for i in range( index, len(entries) ):
+               self.oscAddressHandlers[ entries[i][0] ] = i
+
+         self._dispatcher.setEntries( entries )
 
 
    def _printIncomingMessage_(self, message):
-      """It prints out the incoming OSC message (if desired)."""
+      """It prints out the incoming OSC message (registered only while showIncomingMessages is enabled)."""
 
-      ### don't do this if showIncomingMessages is disabled
-      if self.showIncomingMessages:
-      
-         ### unpack message
-         oscAddress    = message.getAddress()
-         argumentList  = message.getArguments()
+      ### unpack message
+      oscAddress    = message.getAddress()
+      argumentList  = message.getArguments()
+
+      ### format arguments - strings get double quotes, everything else gets nothing
+      argumentStrings = [ '"' + argument + '"' if isinstance(argument, basestring) else str(argument)
+                          for argument in argumentList ]
 
-         ### print incoming address and arguments
-         print "OSC In - Address:", '"' + str(oscAddress) + '"',       
-         for i in range( len(argumentList) ):
-            ### check for argument type
-            if type(argumentList[i]) == unicode: # strings get double quotes
-               print ", Argument " + str(i) + ': "' + argumentList[i] + '"',
-            else: # everything else gets nothing
-               print ", Argument " + str(i) + ": " + str(argumentList[i]),
-         print
+      ### print incoming address and arguments (all at once, on the same line)
+      print 'OSC In - Address: "' + str(oscAddress) + '"' + \
+            "".join( [", Argument " + str(i) + ": " + argumentString for i, argumentString in enumerate(argumentStrings)] )
 
 
    def showMessages(self):
@@ -245,59 +461,214 @@ class OscIn():
       Turns on printing of incoming OSC messages (useful for exploring what OSC messages 
       are generated by a particular device).
       """
-      self.showIncomingMessages = True
+      if not self.showIncomingMessages:
+         self.showIncomingMessages = True
+         self.onInput( ALL_MESSAGES, self._printIncomingMessage_ )
 
 
    def hideMessages(self):
       """
       Turns off printing of incoming OSC messages.
       """
-      self.showIncomingMessages = False
+      if self.showIncomingMessages:
+         self.showIncomingMessages = False
+         self._removeInput_( ALL_MESSAGES, self._printIncomingMessage_ )
+
+
+   def stop(self):
+      """
+      Stops receiving OSC messages, freeing this object's port
+      (the only way to free it, besides dispose() when the program ends).
+      """
+      self.oscIn.stop()
+
+      ### stop dispatcher thread (the interrupt only wakes it up sooner - see ProcessingListener.run())
+      self._dispatcher.stop()
+      self._dispatchThread.interrupt()
 
 
 
 ############# helper classes for OscIn #################
-class ProcessingListener( OscEventListener ):
+class ProcessingListener( OscEventListener, Runnable ):
+   """
+   Receives every OSC message arriving at an OscIn object, and calls the functions
+   registered to each address pattern that matches it.
+
+   Messages are received on OscP5's thread, and queued for the thread that runs this
+   listener (see run()), which calls the registered functions.
+   """
+
+   def __init__(self, queueSize = 1024, batchSize = 64):
+      ### incoming messages waiting to be dispatched
+      #   (if full, new messages are dropped, as the network would if we could not keep up)
+      self._queue     = ArrayBlockingQueue( queueSize )
+      self._batchSize = batchSize   # most messages to take from the queue at once (see run())
+
+      ### has OscP5's receiving thread been given maximum priority yet? (see oscEvent())
+      self._prioritized = False
 
+      ### should the dispatcher thread keep running? (see run() and stop())
+      self._running = True
 
-   def __init__(self, oscAddress = None, function = None):
-      self.oscAddress   = oscAddress
-      self.functionList = [ function ]
+      self.setEntries( [] )
+
+   def setEntries(self, entries):
+      """
+      Replaces the registered addresses with entries, a list of (address, compiled address pattern, 
+      tuple of functions) triples (the compiled pattern is None for literal addresses).
+      """
+
+      ### index literal addresses by the address itself (they match only that exact address), and
+      #   regular expressions by the literal beginning of their address, in a trie (one node per character),
+      #   so that only entries whose prefix matches an incoming address need to be checked against it
+      #   (each trie node is a pair - a dictionary of child nodes, and a list of (position, entry) pairs)
+      literals = {}
+      trie     = ({}, [])
+      for index, entry in enumerate( entries ):
+
+         if entry[1] is None:   # literal address
+            literals.setdefault( entry[0], [] ).append( (index, entry) )
+
+         else:                  # regular expression
+            node = trie
+            for character in _staticPrefix_( entry[0] ):
+               node = node[0].setdefault( character, ({}, []) )
+            node[1].append( (index, entry) )
+
+      ### publish the new indexes, together with a fresh cache of incoming address -> functions
+      #   it matches, in a single assignment, so that the dispatcher thread (see dispatch())
+      #   never combines parts of the old and new registrations
+      self.entries   = entries
+      self._snapshot = (literals, trie, OrderedDict())
 
    def oscEvent(self, message):
       """
-      When an OSC message is received, check it against this Listener's assigned address.
-      If it matches, call registered functions. Otherwise, do nothing.
+      When an OSC message is received, queue it for dispatching (and return immediately,
+      so that OscP5 can go on receiving).
+      """
+
+      ### OscP5 does not expose its receiving thread, but this is called from it, so raise its
+      #   priority here (once), so that rendering and garbage collection delay receiving less
+      if not self._prioritized:
+         self._prioritized = True
+         try:
+            Thread.currentThread().setPriority( Thread.MAX_PRIORITY )
+         except:   # e.g. not allowed by the JVM's security manager - keep default priority
+            pass
+
+      self._queue.offer( message )
+
+   def stop(self):
+      """
+      Tells the dispatcher thread to finish (within _STOP_CHECK_MILLISECONDS_, see run()).
+      """
+      self._running = False
+
+   def run(self):
+      """
+      Dispatches queued messages, until stop() is called (see OscIn.stop()).
       """
 
-      ### unpack incoming message address
+      queue     = self._queue
+      batchSize = self._batchSize
+      batch     = ArrayList( batchSize )   # reused for every batch
+
+      ### check whether to stop every time around (not just when interrupted, since registered functions
+      #   may swallow the interrupt - e.g. Processing's delay() ignores InterruptedException)
+      while self._running:
+
+         ### take all waiting messages at once (up to batchSize), or wait a little for the next one
+         #   (waiting a limited time, so that we get to check _running again even if nothing arrives)
+         if queue.drainTo( batch, batchSize ) == 0:
+            try:
+               message = queue.poll( _STOP_CHECK_MILLISECONDS_, TimeUnit.MILLISECONDS )
+            except InterruptedException:   # woken up by OscIn.stop()
+               continue
+
+            if message is None:   # nothing arrived in time
+               continue
+
+            batch.add( message )
+
+         for message in batch:
+
+            ### errors in registered functions should not stop dispatching of later messages
+            try:
+               self.dispatch( message )
+            except:
+               traceback.print_exc()
+
+         batch.clear()
+
+   def dispatch(self, message):
+      """
+      Calls the functions registered to each address that matches the incoming message.
+      """
+
+      ### this runs for every incoming message, so look up everything needed only once
+      #   (local variables are cheaper to access than attributes)
       incomingAddress = message.addrPattern()
+      literals, trie, addressCache = self._snapshot
+
+      ### devices send the same few addresses over and over (e.g. "/1/fader1"), so remember
+      #   which functions each incoming address matched
+      #   (taken out and put back at the end on every message, so that the least recently used
+      #   addresses, not the most frequent ones, are forgotten first)
+      functions = addressCache.pop( incomingAddress, None )
+      if functions is None:
+         functions = self._matchFunctions_( incomingAddress, literals, trie )
 
-      ### check against registered address
-      if self.oscAddress == incomingAddress:
+         ### make room, if needed (least recently used first)
+         if len(addressCache) >= _ADDRESS_CACHE_SIZE_:
+            addressCache.popitem( last = False )
 
-         ### unpack incoming message arguments
-         #   messages come in as java arrays, so translate to python list
-         oscArguments = message.arguments()
-         # oscArgumentsList = []
-         # for argument in oscArguments:
-         #    oscArgumentsList.append( argument )
+      addressCache[incomingAddress] = functions
 
-         ### repack into OSCMessage
-         oscMessage   = OSCMessage( incomingAddress, oscArguments )
+      if functions:
 
-         ### call functions registered to oscAddress
-         for function in self.functionList:
+         ### wrap incoming message (once, for all functions), so that callbacks
+         #   can use the same methods as in JEM
+         oscMessage = OSCMessage( message )
+
+         ### call functions registered to matching addresses
+         for function in functions:
             function( oscMessage )
 
-   def addFunction(self, function):
-      self.functionList.append( function )
+   def _matchFunctions_(self, incomingAddress, literals, trie):
+      """
+      Returns a tuple of the functions registered to addresses that match incomingAddress,
+      in the order in which the addresses were registered (literals and trie are the indexes
+      built by setEntries()).
+      """
+
+      ### collect literal addresses equal to the incoming address (by a single lookup), and
+      #   regular expressions whose prefix the incoming address starts with (by walking down the trie)
+      node       = trie
+      candidates = literals.get( incomingAddress, [] ) + node[1]
+      for character in incomingAddress:
+         node = node[0].get( character )
+         if node is None:
+            break
+         candidates.extend( node[1] )
 
-   def getAddress(self):
-      return self.oscAddress
+      ### keep the order in which addresses were registered
+      candidates.sort()
 
-   def setAddress(self, newOscAddress):
-      self.oscAddress = newOscAddress
+      ### check against candidate addresses (more than one may match)
+      functions = ()
+      for index, (oscAddress, regex, entryFunctions) in candidates:
+
+         ### literal addresses were found by the incoming address itself, and prefix addresses
+         #   (e.g. ALL_MESSAGES) already match, as candidates start with their prefix
+         if regex is None or regex is _MATCH_PREFIX_:
+            pass
+
+         elif regex.match( incomingAddress ) is None:
+            continue
+
+         functions += entryFunctions
+
+      return functions
 
 
 
@@ -307,21 +678,25 @@ class OSCMessage( OscPacket ):
    Users can use the same methods they would use in JEM to pack and unpack messages in Processing.
    """
 
-   def __init__(self, oscAddress, *arguments):
-      self.oscAddress = oscAddress
-      self.arguments  = arguments
+   def __init__(self, oscPacket):
+      ### a view of the incoming OscP5 message, not a copy of it
+      self._p = oscPacket
 
    def addArgument(self, newArgument):
-      self.arguments.append( newArgument )
+      self._p.add( newArgument )
 
    def getAddress(self):
-      return self.oscAddress
+      return self._p.addrPattern()
 
    def getArguments(self):
-      return self.arguments
+      ### a java array (no copy), which can be indexed and iterated like a list
+      return self._p.arguments()
+
+   def getArgumentsAsList(self):
+      return list( self._p.arguments() )
 
    def setAddress(self, newOscAddress):
-      self.oscAddress = newOscAddress
+      self._p.setAddrPattern( newOscAddress )
 
 
 
@@ -393,22 +768,18 @@ def dispose():
    """Processing calls this function before shutting down.
    It cleans up any active OscIn or OscOut objects, freeing our ports."""
 
-   ### stop OscIn objects
-   for oscIn in _ActiveOscInObjects_:
+   ### stop OscIn objects (those still alive)
+   for oscIn in list( _ActiveOscInObjects_ ):
       oscIn.stop()
 
    # ### stop OscOut objects
    # for oscOut in _ActiveOscOutObjects_:
    #    oscOut.stop()
 
-   ### delete these objects
-#   for oscObject in (_ActiveOscInObjects_ + _ActiveOscOutObjects_):
-   for oscObject in _ActiveOscInObjects_:
-      del oscObject
-
    ### and forget they existed
-   _ActiveOscInObjects_  = []
-#   _ActiveOscOutObjects_ = []
+   #   (empty the sets in place - assigning new ones here would only create local variables)
+   _ActiveOscInObjects_.clear()
+#   _ActiveOscOutObjects_.clear()
 
 
 